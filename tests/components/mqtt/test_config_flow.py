@@ -387,13 +387,12 @@ def get_default(schema, key):
             return k.default()
 
 
-def get_suggested(schema, key):
-    """Get suggested value for key in voluptuous schema."""
-    for k in schema.keys():
-        if k == key:
-            if k.description is None or "suggested_value" not in k.description:
-                return None
-            return k.description["suggested_value"]
+def get_suggested_values(schema):
+    """Get suggested values for all keys in voluptuous schema."""
+    return {
+        k: None if k.description is None else k.description.get("suggested_value")
+        for k in schema.keys()
+    }
 
 
 async def test_option_flow_default_suggested_values(
@@ -435,8 +434,9 @@ async def test_option_flow_default_suggested_values(
     }
     for k, v in defaults.items():
         assert get_default(result["data_schema"].schema, k) == v
+    suggested_values = get_suggested_values(result["data_schema"].schema)
     for k, v in suggested.items():
-        assert get_suggested(result["data_schema"].schema, k) == v
+        assert suggested_values[k] == v
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
@@ -464,8 +464,9 @@ async def test_option_flow_default_suggested_values(
     }
     for k, v in defaults.items():
         assert get_default(result["data_schema"].schema, k) == v
+    suggested_values = get_suggested_values(result["data_schema"].schema)
     for k, v in suggested.items():
-        assert get_suggested(result["data_schema"].schema, k) == v
+        assert suggested_values[k] == v
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
@@ -497,8 +498,9 @@ async def test_option_flow_default_suggested_values(
     }
     for k, v in defaults.items():
         assert get_default(result["data_schema"].schema, k) == v
+    suggested_values = get_suggested_values(result["data_schema"].schema)
     for k, v in suggested.items():
-        assert get_suggested(result["data_schema"].schema, k) == v
+        assert suggested_values[k] == v
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
@@ -521,8 +523,9 @@ async def test_option_flow_default_suggested_values(
     }
     for k, v in defaults.items():
         assert get_default(result["data_schema"].schema, k) == v
+    suggested_values = get_suggested_values(result["data_schema"].schema)
     for k, v in suggested.items():
-        assert get_suggested(result["data_schema"].schema, k) == v
+        assert suggested_values[k] == v
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
@@ -704,8 +707,9 @@ async def test_try_connection_with_advanced_parameters(
         }
         for k, v in defaults.items():
             assert get_default(result["data_schema"].schema, k) == v
+        suggested_values = get_suggested_values(result["data_schema"].schema)
         for k, v in suggested.items():
-            assert get_suggested(result["data_schema"].schema, k) == v
+            assert suggested_values[k] == v
 
         result = await hass.config_entries.options.async_configure(
             result["flow_id"],
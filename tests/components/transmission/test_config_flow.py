@@ -51,32 +51,6 @@ def mock_transmission_api():
         yield
 
 
-@pytest.fixture(name="auth_error")
-def mock_api_authentication_error():
-    """Mock an api."""
-    with patch(
-        "transmissionrpc.Client", side_effect=TransmissionError("401: Unauthorized")
-    ):
-        yield
-
-
-@pytest.fixture(name="conn_error")
-def mock_api_connection_error():
-    """Mock an api."""
-    with patch(
-        "transmissionrpc.Client",
-        side_effect=TransmissionError("111: Connection refused"),
-    ):
-        yield
-
-
-@pytest.fixture(name="unknown_error")
-def mock_api_unknown_error():
-    """Mock an api."""
-    with patch("transmissionrpc.Client", side_effect=TransmissionError):
-        yield
-
-
 @pytest.fixture(name="transmission_setup", autouse=True)
 def transmission_setup_fixture():
     """Mock transmission entry setup."""
@@ -110,11 +84,11 @@ async def test_flow_required_fields(hass, api):
         data={CONF_NAME: NAME, CONF_HOST: HOST, CONF_PORT: PORT},
     )
 
+    expected_data = {CONF_NAME: NAME, CONF_HOST: HOST, CONF_PORT: PORT}
     assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
     assert result["title"] == NAME
-    assert result["data"][CONF_NAME] == NAME
-    assert result["data"][CONF_HOST] == HOST
-    assert result["data"][CONF_PORT] == PORT
+    assert result["data"] == expected_data
+    assert result["result"].data == expected_data
 
 
 async def test_flow_all_provided(hass, api):
@@ -125,13 +99,17 @@ async def test_flow_all_provided(hass, api):
         data=MOCK_ENTRY,
     )
 
+    expected_data = {
+        CONF_NAME: NAME,
+        CONF_HOST: HOST,
+        CONF_USERNAME: USERNAME,
+        CONF_PASSWORD: PASSWORD,
+        CONF_PORT: PORT,
+    }
     assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
     assert result["title"] == NAME
-    assert result["data"][CONF_NAME] == NAME
-    assert result["data"][CONF_HOST] == HOST
-    assert result["data"][CONF_USERNAME] == USERNAME
-    assert result["data"][CONF_PASSWORD] == PASSWORD
-    assert result["data"][CONF_PORT] == PORT
+    assert result["data"] == expected_data
+    assert result["result"].data == expected_data
 
 
 async def test_options(hass):
@@ -259,55 +237,22 @@ async def test_name_already_configured(hass, api):
     assert result["errors"] == {CONF_NAME: "name_exists"}
 
 
-async def test_error_on_wrong_credentials(hass, auth_error):
-    """Test with wrong credentials."""
-    flow = init_config_flow(hass)
-
-    result = await flow.async_step_user(
-        {
-            CONF_NAME: NAME,
-            CONF_HOST: HOST,
-            CONF_USERNAME: USERNAME,
-            CONF_PASSWORD: PASSWORD,
-            CONF_PORT: PORT,
-        }
-    )
-    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
-    assert result["errors"] == {
-        CONF_USERNAME: "invalid_auth",
-        CONF_PASSWORD: "invalid_auth",
-    }
-
-
-async def test_error_on_connection_failure(hass, conn_error):
-    """Test when connection to host fails."""
-    flow = init_config_flow(hass)
-
-    result = await flow.async_step_user(
-        {
-            CONF_NAME: NAME,
-            CONF_HOST: HOST,
-            CONF_USERNAME: USERNAME,
-            CONF_PASSWORD: PASSWORD,
-            CONF_PORT: PORT,
-        }
-    )
-    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_error_on_unknown_error(hass, unknown_error):
-    """Test when connection to host fails."""
+@pytest.mark.parametrize(
+    "side_effect,errors",
+    [
+        (
+            TransmissionError("401: Unauthorized"),
+            {CONF_USERNAME: "invalid_auth", CONF_PASSWORD: "invalid_auth"},
+        ),
+        (TransmissionError("111: Connection refused"), {"base": "cannot_connect"}),
+        (TransmissionError, {"base": "cannot_connect"}),
+    ],
+)
+async def test_error_on_api_failure(hass, side_effect, errors):
+    """Test the form errors shown when connecting to the api fails."""
     flow = init_config_flow(hass)
 
-    result = await flow.async_step_user(
-        {
-            CONF_NAME: NAME,
-            CONF_HOST: HOST,
-            CONF_USERNAME: USERNAME,
-            CONF_PASSWORD: PASSWORD,
-            CONF_PORT: PORT,
-        }
-    )
+    with patch("transmissionrpc.Client", side_effect=side_effect):
+        result = await flow.async_step_user(MOCK_ENTRY)
     assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
-    assert result["errors"] == {"base": "cannot_connect"}
+    assert result["errors"] == errors
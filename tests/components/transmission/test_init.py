@@ -1,6 +1,7 @@
 """Tests for Transmission init."""
 
-from unittest.mock import patch
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from transmissionrpc.error import TransmissionError
@@ -9,18 +10,41 @@ from homeassistant.components import transmission
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.setup import async_setup_component
 
-from tests.common import MockConfigEntry, mock_coro
-
-MOCK_ENTRY = MockConfigEntry(
-    domain=transmission.DOMAIN,
-    data={
-        transmission.CONF_NAME: "Transmission",
-        transmission.CONF_HOST: "0.0.0.0",
-        transmission.CONF_USERNAME: "user",
-        transmission.CONF_PASSWORD: "pass",
-        transmission.CONF_PORT: 9091,
-    },
-)
+from tests.common import MockConfigEntry
+
+MOCK_DATA = {
+    transmission.CONF_NAME: "Transmission",
+    transmission.CONF_HOST: "0.0.0.0",
+    transmission.CONF_USERNAME: "user",
+    transmission.CONF_PASSWORD: "pass",
+    transmission.CONF_PORT: 9091,
+}
+
+
+@pytest.fixture(name="transmission_config", scope="module")
+def transmission_config_fixture():
+    """Return the YAML configuration for two Transmission instances.
+
+    Shared by every test in the module, so it must not be mutated.
+    """
+    return {
+        transmission.DOMAIN: [
+            MOCK_DATA,
+            {
+                transmission.CONF_NAME: "Transmission2",
+                transmission.CONF_HOST: "0.0.0.1",
+                transmission.CONF_USERNAME: "user",
+                transmission.CONF_PASSWORD: "pass",
+                transmission.CONF_PORT: 9091,
+            },
+        ]
+    }
+
+
+@pytest.fixture(name="entry")
+def mock_config_entry():
+    """Return a fresh Transmission config entry."""
+    return MockConfigEntry(domain=transmission.DOMAIN, data=MOCK_DATA)
 
 
 @pytest.fixture(name="api")
@@ -30,53 +54,28 @@ def mock_transmission_api():
         yield
 
 
-@pytest.fixture(name="auth_error")
-def mock_api_authentication_error():
-    """Mock an api."""
-    with patch(
-        "transmissionrpc.Client", side_effect=TransmissionError("401: Unauthorized")
-    ):
-        yield
-
-
-@pytest.fixture(name="unknown_error")
-def mock_api_unknown_error():
-    """Mock an api."""
-    with patch("transmissionrpc.Client", side_effect=TransmissionError):
-        yield
-
-
 async def test_setup_with_no_config(hass):
     """Test that we do not discover anything or try to set up a Transmission client."""
     assert await async_setup_component(hass, transmission.DOMAIN, {}) is True
     assert transmission.DOMAIN not in hass.data
 
 
-async def test_setup_with_config(hass, api):
+async def test_setup_with_config(hass, api, transmission_config):
     """Test that we import the config and setup the client."""
-    config = {
-        transmission.DOMAIN: {
-            transmission.CONF_NAME: "Transmission",
-            transmission.CONF_HOST: "0.0.0.0",
-            transmission.CONF_USERNAME: "user",
-            transmission.CONF_PASSWORD: "pass",
-            transmission.CONF_PORT: 9091,
-        },
-        transmission.DOMAIN: {
-            transmission.CONF_NAME: "Transmission2",
-            transmission.CONF_HOST: "0.0.0.1",
-            transmission.CONF_USERNAME: "user",
-            transmission.CONF_PASSWORD: "pass",
-            transmission.CONF_PORT: 9091,
-        },
-    }
-    assert await async_setup_component(hass, transmission.DOMAIN, config) is True
+    with patch(
+        "homeassistant.components.transmission.async_setup_entry", return_value=True
+    ):
+        assert (
+            await async_setup_component(hass, transmission.DOMAIN, transmission_config)
+            is True
+        )
+        await hass.async_block_till_done()
 
+    assert len(hass.config_entries.async_entries(transmission.DOMAIN)) == 2
 
-async def test_successful_config_entry(hass, api):
-    """Test that configured transmission is configured successfully."""
 
-    entry = MOCK_ENTRY
+async def test_successful_config_entry(hass, api, entry):
+    """Test that configured transmission is configured successfully."""
     entry.add_to_hass(hass)
 
     assert await transmission.async_setup_entry(hass, entry) is True
@@ -87,36 +86,35 @@ async def test_successful_config_entry(hass, api):
     }
 
 
-async def test_setup_failed(hass):
+# result is only checked when setup does not raise
+@pytest.mark.parametrize(
+    "side_effect,expectation,result",
+    [
+        (
+            TransmissionError("111: Connection refused"),
+            pytest.raises(ConfigEntryNotReady),
+            None,
+        ),
+        (TransmissionError("401: Unauthorized"), nullcontext(), False),
+    ],
+    ids=["not_ready", "auth_failed"],
+)
+async def test_setup_failed(hass, entry, side_effect, expectation, result):
     """Test transmission failed due to an error."""
-
-    entry = MOCK_ENTRY
     entry.add_to_hass(hass)
 
-    # test connection error raising ConfigEntryNotReady
-    with patch(
-        "transmissionrpc.Client",
-        side_effect=TransmissionError("111: Connection refused"),
-    ), pytest.raises(ConfigEntryNotReady):
-
-        await transmission.async_setup_entry(hass, entry)
-
-    # test Authentication error returning false
-
-    with patch(
-        "transmissionrpc.Client", side_effect=TransmissionError("401: Unauthorized")
-    ):
-
-        assert await transmission.async_setup_entry(hass, entry) is False
+    with patch("transmissionrpc.Client", side_effect=side_effect), expectation:
+        assert await transmission.async_setup_entry(hass, entry) is result
 
 
-async def test_unload_entry(hass, api):
+async def test_unload_entry(hass, api, entry):
     """Test removing transmission client."""
-    entry = MOCK_ENTRY
     entry.add_to_hass(hass)
 
     with patch.object(
-        hass.config_entries, "async_forward_entry_unload", return_value=mock_coro(True)
+        hass.config_entries,
+        "async_forward_entry_unload",
+        new=AsyncMock(return_value=True),
     ) as unload_entry:
         assert await transmission.async_setup_entry(hass, entry)
 